@@ -30,11 +30,16 @@ For deployment instructions see README.md and the ``render.yaml`` file.
 """
 
 import os
-from dash import Dash, html, dash_table, dcc, callback, Output, Input, ctx
+import tempfile
+from dash import Dash, html, dcc, callback, Output, Input, State, ctx, no_update
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 import dash_bootstrap_components as dbc
+from numba import njit
+from flask_caching import Cache
 
 
 # Determine the path to the CSV.  Use the CSV_PATH environment variable
@@ -43,24 +48,83 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DEFAULT_CSV = os.path.join(BASE_DIR, "electricityConsumptionAndProductioction.csv")
 CSV_PATH = os.environ.get("CSV_PATH", DEFAULT_CSV)
 
-# Load the CSV into a DataFrame.  If the file is missing, an exception
-# will be raised and logged in the Render deploy logs.
-df = pd.read_csv(CSV_PATH)
+# Parsing the CSV text is the slowest part of start-up, so the parsed
+# frame is cached next to it as Parquet and reused while it is newer than
+# the CSV.  Delete the ``.parquet`` file to force a re-parse.  Bump
+# ``CACHE_VERSION`` whenever ``_load_data`` changes what it reads, so caches
+# written by an older loader are ignored.
+CACHE_VERSION = 2
+PARQUET_PATH = f"{CSV_PATH}.v{CACHE_VERSION}.parquet"
 
-# Parse the timestamp column and derive additional fields used for grouping.
-df["DateTime"] = pd.to_datetime(df["DateTime"])
-df = df.sort_values("DateTime").reset_index(drop=True)
+# Define the list of power sources expected in the CSV.  Only include
+# those columns that actually exist in the data to avoid errors when
+# selecting from missing columns.
+SOURCES = ["Nuclear", "Wind", "Hydroelectric", "Oil and Gas", "Coal", "Solar", "Biomass"]
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+def _load_data(csv_path: str, cache_path: str) -> pd.DataFrame:
+    """
+    Load the electricity data, preferring the Parquet cache when it is fresh.
 
+    Parameters
+    ----------
+    csv_path : str
+        Path to the source CSV file.
+    cache_path : str
+        Path of the Parquet cache written after the first CSV parse.
+
+    Returns
+    -------
+    DataFrame
+        The raw data sorted by ``DateTime``, with numeric columns as float32.
+        Columns the dashboard does not use are not loaded.
+    """
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(csv_path):
+        try:
+            return pd.read_parquet(cache_path, engine="pyarrow")
+        except (OSError, ValueError):
+            # An unreadable cache is rebuilt from the CSV below.
+            pass
+
+    # If the file is missing, an exception will be raised and logged in
+    # the Render deploy logs.
+    numeric = {c: "float32" for c in SOURCES + ["Consumption", "Production"]}
+    data = pd.read_csv(csv_path, usecols=lambda c: c == "DateTime" or c in numeric,
+                       parse_dates=["DateTime"], dtype=numeric)
+    data = data.sort_values("DateTime").reset_index(drop=True)
+    # Write to a temporary file and rename it into place, so an interrupted
+    # write or a concurrent worker never leaves a truncated cache behind.
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(cache_path) + ".", suffix=".tmp",
+                                        dir=os.path.dirname(cache_path) or ".")
+        os.close(fd)
+        os.chmod(tmp_path, 0o644)
+        data.to_parquet(tmp_path, engine="pyarrow", compression="zstd", index=False)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # A read-only deploy directory only costs us the cache.
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return data
+
+
+df = _load_data(CSV_PATH, PARQUET_PATH)
+
+# Derive additional fields used for grouping.  ``MonthIdx`` counts months
+# from the first one in the data and is the compact key used by the
+# monthly aggregations; ``MONTH_STARTS[i]`` is the date of month ``i``.
 df["MonthStart"] = df["DateTime"].dt.to_period("M").dt.start_time
-df["Weekday"] = df["DateTime"].dt.day_name()
-df["Hour"] = df["DateTime"].dt.hour
+df["Weekday"] = df["DateTime"].dt.day_name().astype(pd.CategoricalDtype(WEEKDAYS, ordered=True))
+df["Hour"] = df["DateTime"].dt.hour.astype("int8")
 min_date = df["DateTime"].min().date()
 max_date = df["DateTime"].max().date()
+df["MonthIdx"] = ((df["DateTime"].dt.year - min_date.year) * 12
+                  + df["DateTime"].dt.month - min_date.month).astype("int32")
+MONTH_STARTS = pd.date_range(df["MonthStart"].iloc[0], periods=int(df["MonthIdx"].iloc[-1]) + 1,
+                             freq="MS", name="MonthStart")
 
-# Define the list of power sources expected in the CSV.  Only include
-# those columns that actually exist in the data to avoid errors when
-# selecting from missing columns.
-SOURCES = ["Nuclear", "Wind", "Hydroelectric", "Oil and Gas", "Coal", "Solar", "Biomass"]
 sources_avail = [s for s in SOURCES if s in df.columns]
 
 # Build the options for the metric dropdown.  Use human‑friendly labels.
@@ -75,6 +139,59 @@ if not metric_options:
     metric_options = [{"label": s, "value": s} for s in sources_avail]
 default_metric = metric_options[0]["value"]
 
+# Upper bound on the number of points sent to the browser for the time
+# series; longer ranges are reduced by ``_downsample``.
+MAX_LINE_POINTS = 4000
+
+# Aggregates that do not depend on the selected date range are computed
+# once here so the callbacks only have to slice them.  ``MONTHLY`` maps an
+# aggregation name to a MonthStart-indexed frame.
+NUMERIC_COLS = [c for c in ["Consumption", "Production"] + SOURCES if c in df.columns]
+
+
+def _group_months(frame: pd.DataFrame, cols, agg: str):
+    """Aggregate ``cols`` of ``frame`` per month, indexed by ``MonthStart``."""
+    # Rows are sorted by date, so the groups already come out in month order.
+    out = frame.groupby("MonthIdx", sort=False)[cols].agg(agg)
+    out.index = MONTH_STARTS[out.index]
+    return out
+
+
+MONTHLY = {agg: _group_months(df, NUMERIC_COLS, agg) for agg in ("sum", "mean", "max")}
+
+# The callbacks work on plain arrays rather than on ``df``: ``DT`` holds
+# the sorted timestamps and ``COLS`` one float32 array per numeric column,
+# so a date range is just a ``[lo:hi]`` slice of each.
+DT = df["DateTime"].values
+COLS = {c: df[c].values for c in NUMERIC_COLS}
+
+# Row bounds of every calendar day in the data, keyed by the "YYYY-MM-DD"
+# strings the date picker sends: rows of day ``d`` run from
+# ``DAY_START_ROW[d]`` up to ``DAY_END_ROW[d]``.
+_days = pd.date_range(min_date, max_date, freq="D")
+_day_keys = _days.strftime("%Y-%m-%d")
+DAY_START_ROW = dict(zip(_day_keys, DT.searchsorted(_days.values).tolist()))
+DAY_END_ROW = dict(zip(_day_keys, DT.searchsorted((_days + pd.Timedelta(days=1)).values).tolist()))
+
+# The sources are also stacked into one (sources, rows) matrix so the
+# sources chart can reduce all selected columns in a single kernel call.
+SOURCE_ROW = {s: k for k, s in enumerate(sources_avail)}
+SOURCE_MATRIX = (np.vstack([COLS[s] for s in sources_avail]) if sources_avail
+                 else np.empty((0, len(df)), dtype=np.float32))
+
+# Heatmap bins: every row falls into one of 7 × 24 (weekday, hour) cells.
+# ``HEAT_SUMS[col]`` and ``HEAT_COUNTS`` hold per-month totals of shape
+# (months, 168), and month ``m`` covers rows ``MONTH_BOUNDS[m]`` up to
+# ``MONTH_BOUNDS[m + 1]``.
+HEAT_BUCKET = (df["DateTime"].dt.weekday.values * 24 + df["Hour"].values).astype(np.int64)
+MONTH_IDX = df["MonthIdx"].values
+MONTH_BOUNDS = np.concatenate([[0], np.flatnonzero(MONTH_IDX[1:] != MONTH_IDX[:-1]) + 1, [len(df)]])
+_n_months = len(MONTH_BOUNDS) - 1
+_cells = np.repeat(np.arange(_n_months), np.diff(MONTH_BOUNDS)) * 168 + HEAT_BUCKET
+HEAT_COUNTS = np.bincount(_cells, minlength=_n_months * 168).reshape(_n_months, 168)
+HEAT_SUMS = {c: np.bincount(_cells, weights=COLS[c], minlength=_n_months * 168).reshape(_n_months, 168)
+             for c in NUMERIC_COLS}
+
 # Initialize the Dash app with a bootstrap theme.  Expose the Flask
 # server object for gunicorn.  In production gunicorn will import this
 # module and look for ``server``.
@@ -82,6 +199,25 @@ external_stylesheets = [dbc.themes.CERULEAN]
 app = Dash(__name__, external_stylesheets=external_stylesheets)
 server = app.server
 
+# Memoize the data behind each figure, keyed only on the inputs that
+# change the numbers, so theme or chart-type toggles skip the aggregation.
+cache = Cache(server, config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 600})
+
+
+# Plotly.js needs the full template object rather than its name, so the
+# two themes are shipped to the browser once for the clientside callbacks.
+TEMPLATES = {name: pio.templates[name].to_plotly_json() for name in ("plotly", "plotly_dark")}
+
+# The data preview never changes, so it is built once as a Plotly table
+# and serialized here instead of on every page load.  The float32 columns
+# are shown with float32 precision so the CSV's integers read as integers.
+_preview = df.drop(columns="MonthIdx").head(200)
+PREVIEW_FIGURE = go.Figure(go.Table(
+    header=dict(values=list(_preview.columns), font=dict(size=12, family="Arial")),
+    cells=dict(values=[_preview[c].map("{:.7g}".format) if c in NUMERIC_COLS else _preview[c].astype(str)
+                       for c in _preview.columns],
+               font=dict(size=12, family="Arial"))
+)).update_layout(height=400, margin=dict(l=10, r=10, t=10, b=10)).to_dict()
 
 # Layout definition
 app.layout = dbc.Container([
@@ -115,7 +251,8 @@ app.layout = dbc.Container([
                 dbc.Button("Claro", id="btn-light", outline=True),
                 dbc.Button("Oscuro", id="btn-dark", outline=True)
             ], className="d-block"),
-            dcc.Store(id="theme-store", data={"template": "plotly"})
+            dcc.Store(id="theme-store", data={"template": "plotly"}),
+            dcc.Store(id="templates-store", data=TEMPLATES)
         ], md=4),
     ], className="my-2"),
 
@@ -194,12 +331,7 @@ app.layout = dbc.Container([
     dbc.Row([
         dbc.Col([
             html.H5("Vista de datos (primeras 200 filas)", className="text-primary"),
-            dash_table.DataTable(
-                data=df.head(200).to_dict('records'),
-                page_size=10,
-                style_table={'overflowX': 'auto'},
-                style_cell={"fontSize": 12, "fontFamily": "Arial"}
-            )
+            dcc.Graph(id="data-preview", figure=PREVIEW_FIGURE, config={"displayModeBar": False})
         ])
     ], className="my-3")
 ], fluid=True)
@@ -207,21 +339,45 @@ app.layout = dbc.Container([
 
 # Theme switch callback
 @callback(Output("theme-store", "data"),
-          Input("btn-light", "n_clicks"), Input("btn-dark", "n_clicks"))
+          Input("btn-light", "n_clicks"), Input("btn-dark", "n_clicks"),
+          prevent_initial_call=True)
 def switch_theme(n_light, n_dark):
     """Switch between light and dark Plotly templates."""
     trig = ctx.triggered_id
     return {"template": "plotly_dark"} if trig == "btn-dark" else {"template": "plotly"}
 
 
-def _filter(dfin: pd.DataFrame, start, end) -> pd.DataFrame:
+# Restyle the graphs in the browser when the theme changes.  The figure
+# callbacks only read the theme as State, so a theme switch never reaches
+# the server.
+APPLY_TEMPLATE_JS = """
+function(theme, fig, templates) {
+    if (!fig) {
+        return window.dash_clientside.no_update;
+    }
+    const layout = Object.assign({}, fig.layout, {template: templates[theme.template]});
+    return Object.assign({}, fig, {layout: layout});
+}
+"""
+for _graph in ("graph-line", "graph-sources", "graph-monthly-bar", "graph-heatmap"):
+    app.clientside_callback(
+        APPLY_TEMPLATE_JS,
+        Output(_graph, "figure", allow_duplicate=True),
+        Input("theme-store", "data"),
+        State(_graph, "figure"), State("templates-store", "data"),
+        prevent_initial_call=True
+    )
+
+
+def _bounds(start, end) -> tuple:
     """
-    Filter the input DataFrame between the given start and end dates.
+    Find the rows of ``df`` between the given start and end dates.
+
+    Dates sent by the date picker are looked up in ``DAY_START_ROW`` and
+    ``DAY_END_ROW``; anything else falls back to a binary search of ``DT``.
 
     Parameters
     ----------
-    dfin : DataFrame
-        The DataFrame to filter.
     start : str or datetime
         The start date (inclusive).
     end : str or datetime
@@ -229,25 +385,274 @@ def _filter(dfin: pd.DataFrame, start, end) -> pd.DataFrame:
 
     Returns
     -------
-    DataFrame
-        A copy of the DataFrame filtered by the date range.
+    tuple of int
+        The row positions ``(lo, hi)``; the range is ``df.iloc[lo:hi]``.
     """
     if start is None or end is None:
-        return dfin
-    return dfin[(dfin["DateTime"] >= pd.to_datetime(start)) &
-                (dfin["DateTime"] <= pd.to_datetime(end) + pd.Timedelta(days=1) - pd.Timedelta(seconds=1))].copy()
+        return 0, len(DT)
+    lo = DAY_START_ROW.get(start)
+    if lo is None:
+        lo = int(DT.searchsorted(np.datetime64(pd.to_datetime(start), "ns")))
+    hi = DAY_END_ROW.get(end)
+    if hi is None:
+        hi = int(DT.searchsorted(np.datetime64(pd.to_datetime(end) + pd.Timedelta(days=1), "ns")))
+    return lo, hi
 
 
-# Callbacks to update each graph
-@callback(Output('graph-line', 'figure'),
-          Input('date-range', 'start_date'), Input('date-range', 'end_date'),
-          Input('metric-dropdown', 'value'), Input('theme-store', 'data'))
-def update_line(start_date, end_date, metric, theme):
-    """Update the time series line chart based on selected metric and date range."""
-    dff = _filter(df, start_date, end_date)
+def _split_months(lo: int, hi: int) -> tuple:
+    """
+    Split rows ``lo:hi`` into whole months and partial-month row ranges.
+
+    Returns
+    -------
+    tuple
+        ``(m_lo, m_hi, partial)``: months ``m_lo`` up to ``m_hi`` (positions
+        in ``MONTH_BOUNDS``) lie entirely inside the rows, and ``partial``
+        lists the ``(lo, hi)`` row ranges left over at either end.
+    """
+    m_lo = int(MONTH_BOUNDS.searchsorted(lo))
+    m_hi = int(MONTH_BOUNDS.searchsorted(hi, side="right")) - 1
+    if m_lo < m_hi:
+        return m_lo, m_hi, [(lo, int(MONTH_BOUNDS[m_lo])), (int(MONTH_BOUNDS[m_hi]), hi)]
+    return 0, 0, [(lo, hi)]
+
+
+def _heat_bins(lo: int, hi: int, var: str) -> tuple:
+    """
+    Sum and count ``var`` per (weekday, hour) cell over rows ``lo:hi``.
+
+    Whole months are read from ``HEAT_SUMS``/``HEAT_COUNTS``; only the rows
+    of the partial months at either end are binned directly.
+
+    Returns
+    -------
+    tuple of ndarray
+        The sums and the counts, each of shape (7, 24).
+    """
+    m_lo, m_hi, partial = _split_months(lo, hi)
+    sums = HEAT_SUMS[var][m_lo:m_hi].sum(axis=0)
+    counts = HEAT_COUNTS[m_lo:m_hi].sum(axis=0)
+    values = COLS[var]
+    for a, b in partial:
+        if b > a:
+            sums = sums + np.bincount(HEAT_BUCKET[a:b], weights=values[a:b], minlength=168)
+            counts = counts + np.bincount(HEAT_BUCKET[a:b], minlength=168)
+    return sums.reshape(7, 24), counts.reshape(7, 24)
+
+
+def _downsample(x: np.ndarray, y: np.ndarray, n_out: int = MAX_LINE_POINTS):
+    """
+    Reduce a series to at most about ``n_out`` points for plotting.
+
+    The series is split into equal buckets and the minimum and maximum of
+    each bucket are kept, so peaks and troughs survive the reduction.
+
+    Parameters
+    ----------
+    x, y : ndarray
+        The x and y values of the series, in x order.
+    n_out : int
+        The target number of points.
+
+    Returns
+    -------
+    tuple of ndarray
+        The retained x and y values.
+    """
+    n = len(y)
+    if n <= n_out:
+        return x, y
+    size = -(-n // (n_out // 2))
+    n_bins = -(-n // size)
+    buckets = np.pad(y, (0, n_bins * size - n), mode="edge").reshape(n_bins, size)
+    offsets = np.arange(n_bins) * size
+    idx = np.concatenate([offsets + buckets.argmin(axis=1), offsets + buckets.argmax(axis=1)])
+    idx = np.unique(np.minimum(idx, n - 1))
+    return x[idx], y[idx]
+
+
+def _monthly_agg(lo: int, hi: int, var, agg: str):
+    """
+    Aggregate ``var`` per calendar month over rows ``lo:hi``.
+
+    Months that lie entirely inside the rows are taken from ``MONTHLY``;
+    only the partial months at either end are re-aggregated from the rows.
+
+    Parameters
+    ----------
+    lo, hi : int
+        The row range, as returned by ``_bounds``.
+    var : str or list of str
+        The column to aggregate, or a list of source columns (``"sum"`` only).
+    agg : {"sum", "mean", "max"}
+        The aggregation applied within each month.
+
+    Returns
+    -------
+    Series or DataFrame
+        The monthly aggregate indexed by ``MonthStart``; a DataFrame when
+        ``var`` is a list.
+    """
+    m_lo, m_hi, partial = _split_months(lo, hi)
+    # MONTHLY has one row per month present, in MONTH_BOUNDS order.
+    pieces = [MONTHLY[agg][var].iloc[m_lo:m_hi]]
+    if isinstance(var, str):
+        pieces += [_month_reduce(a, b, var, agg) for a, b in partial]
+    else:
+        pieces += [_month_sum_sources(a, b, var) for a, b in partial]
+    filled = [p for p in pieces if len(p)]
+    return pd.concat(filled).sort_index() if filled else pieces[0]
+
+
+@njit(cache=True)
+def _gb_count(mi, base, out):
+    """Add 1 to ``out[mi[i] - base]`` for each row; ``out`` must start at zero."""
+    for i in range(mi.size):
+        out[mi[i] - base] += 1
+
+
+@njit(cache=True)
+def _gb_sum(mi, v, base, out):
+    """Add each ``v[i]`` to ``out[mi[i] - base]``; ``out`` must start at zero."""
+    for i in range(mi.size):
+        out[mi[i] - base] += v[i]
+
+
+@njit(cache=True)
+def _gb_max(mi, v, base, out):
+    """Keep the largest ``v[i]`` in ``out[mi[i] - base]``; ``out`` must start at -inf."""
+    for i in range(mi.size):
+        if v[i] > out[mi[i] - base]:
+            out[mi[i] - base] = v[i]
+
+
+@njit(cache=True)
+def _gb_sum_rows(mi, values, base, out):
+    """Add ``values[k, i]`` (sources × rows) to ``out[k, mi[i] - base]``; ``out`` must start at zero."""
+    for k in range(values.shape[0]):
+        for i in range(mi.size):
+            out[k, mi[i] - base] += values[k, i]
+
+
+def _month_sum_sources(lo: int, hi: int, sources) -> pd.DataFrame:
+    """
+    Sum each of ``sources`` per month over rows ``lo:hi``.
+
+    The selected rows of ``SOURCE_MATRIX`` are reduced in a single kernel call.
+
+    Returns
+    -------
+    DataFrame
+        One column per source for every month present in the rows, indexed
+        by ``MonthStart``.
+    """
+    if hi <= lo:
+        return pd.DataFrame(columns=list(sources), index=MONTH_STARTS[:0], dtype="float64")
+    mi = MONTH_IDX[lo:hi]
+    base = int(mi[0])
+    out = np.zeros((len(sources), int(mi[-1]) - base + 1))
+    _gb_sum_rows(mi, SOURCE_MATRIX[[SOURCE_ROW[s] for s in sources], lo:hi], base, out)
+    counts = np.zeros(out.shape[1], dtype=np.int64)
+    _gb_count(mi, base, counts)
+    keep = counts > 0
+    return pd.DataFrame(out[:, keep].T, columns=list(sources),
+                        index=MONTH_STARTS[base + np.flatnonzero(keep)])
+
+
+def _month_reduce(lo: int, hi: int, var: str, agg: str) -> pd.Series:
+    """
+    Aggregate ``var`` per month over rows ``lo:hi`` with the Numba kernels.
+
+    Returns
+    -------
+    Series
+        The aggregate of every month present in the rows, indexed by
+        ``MonthStart``.
+    """
+    if hi <= lo:
+        return pd.Series(dtype="float64", index=MONTH_STARTS[:0], name=var)
+    mi = MONTH_IDX[lo:hi]
+    values = COLS[var][lo:hi]
+    base = int(mi[0])
+    counts = np.zeros(mi[-1] - base + 1, dtype=np.int64)
+    _gb_count(mi, base, counts)
+    if agg == "max":
+        out = np.full(counts.size, -np.inf)
+        _gb_max(mi, values, base, out)
+    else:
+        out = np.zeros(counts.size)
+        _gb_sum(mi, values, base, out)
+        if agg == "mean":
+            out /= np.maximum(counts, 1)
+    keep = counts > 0
+    return pd.Series(out[keep], index=MONTH_STARTS[base + np.flatnonzero(keep)], name=var)
+
+
+# The data helpers are keyed on the row bounds rather than on the date
+# strings, so equivalent ranges share one cache entry.
+@cache.memoize()
+def _line_data(lo: int, hi: int, metric: str, view=None) -> dict:
+    """
+    Return the downsampled ``DateTime`` axis and ``metric`` values of the time series chart.
+
+    When the chart is zoomed, ``view`` holds the ``(lo, hi)`` rows on screen:
+    those get the full point budget, while the rest of the range keeps a
+    coarse outline for the range slider.
+    """
+    values = COLS[metric]
+    if view is None:
+        x, y = _downsample(DT[lo:hi], values[lo:hi])
+        return {"DateTime": x, metric: y}
+    vlo, vhi = view
+    parts = [_downsample(DT[lo:vlo], values[lo:vlo], MAX_LINE_POINTS // 4),
+             _downsample(DT[vlo:vhi], values[vlo:vhi]),
+             _downsample(DT[vhi:hi], values[vhi:hi], MAX_LINE_POINTS // 4)]
+    return {"DateTime": np.concatenate([x for x, _ in parts]),
+            metric: np.concatenate([y for _, y in parts])}
+
+
+@cache.memoize()
+def _sources_data(lo: int, hi: int, sources: list) -> dict:
+    """Return the monthly production of each source, plus the ``DateTime`` axis."""
+    monthly = _monthly_agg(lo, hi, list(sources), "sum")
+    data = {"DateTime": monthly.index.values}
+    data.update({s: monthly[s].values for s in sources})
+    return data
+
+
+@cache.memoize()
+def _monthly_bar_data(lo: int, hi: int, var: str, agg: str) -> dict:
+    """Return the ``MonthStart`` axis and the monthly aggregate of ``var``."""
+    monthly = _monthly_agg(lo, hi, var, agg)
+    return {"MonthStart": monthly.index.values, var: monthly.values}
+
+
+@cache.memoize()
+def _heatmap_data(lo: int, hi: int, var: str) -> np.ndarray:
+    """Return the (7, 24) weekday × hour mean of ``var``, NaN where there are no rows."""
+    sums, counts = _heat_bins(lo, hi, var)
+    # Cells without rows are NaN so Plotly leaves them as gaps.
+    return np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+
+
+# Figure builders, one per graph
+def update_line(lo, hi, metric, theme, window=None):
+    """
+    Build the time series line chart based on selected metric and date range.
+
+    ``window`` is the ``(start, end)`` x range the user zoomed to, if any; the
+    rows inside it are sent at full resolution and the zoom is kept.
+    """
+    view = None
+    if window is not None:
+        x0, x1 = (np.datetime64(pd.Timestamp(x), "ns") for x in window)
+        vlo = min(max(lo, int(DT.searchsorted(x0)) - 1), hi)
+        vhi = max(min(hi, int(DT.searchsorted(x1, side="right")) + 1), vlo)
+        view = (vlo, vhi)
+    data = _line_data(lo, hi, metric, view)
     fig = px.line(
-        dff,
-        x='DateTime', y=metric,
+        data, x="DateTime", y=metric,
+        render_mode="webgl",
         template=theme["template"],
         title=f"Serie temporal de {metric}"
     )
@@ -260,46 +665,46 @@ def update_line(start_date, end_date, metric, theme):
             dict(step="all", label="Todo")
         ])
     )
+    if window is not None:
+        fig.update_xaxes(range=list(window))
     fig.update_layout(margin=dict(l=10, r=10, t=50, b=10))
     return fig
 
 
-@callback(Output('graph-sources', 'figure'),
-          Input('date-range', 'start_date'), Input('date-range', 'end_date'),
-          Input('sources-checklist', 'value'),
-          Input('btn-area', 'n_clicks'), Input('btn-lines', 'n_clicks'),
-          Input('theme-store', 'data'))
-def update_sources(start_date, end_date, sources_sel, n_area, n_lines, theme):
-    """Update the production-by-source chart as either stacked area or lines."""
-    dff = _filter(df, start_date, end_date)
+def _zoom_window(relayout: dict):
+    """Return the ``(start, end)`` x range set in ``relayoutData``, or None for the full view."""
+    if "xaxis.range[0]" in relayout and "xaxis.range[1]" in relayout:
+        return relayout["xaxis.range[0]"], relayout["xaxis.range[1]"]
+    return None
+
+
+def update_sources(lo, hi, sources_sel, n_area, n_lines, theme):
+    """Build the production-by-source chart as either stacked area or lines."""
     if not sources_sel:
         fig = go.Figure()
         fig.update_layout(title="Selecciona al menos una fuente", template=theme["template"])
         return fig
     view = "lines" if (n_lines or 0) > (n_area or 0) else "area"
-    monthly = dff.set_index("DateTime")[sources_sel].resample("M").sum().reset_index()
+    # Stacked areas have no WebGL renderer, so only the line view uses it.
+    extra = {} if view == "area" else {"render_mode": "webgl"}
     fig = (px.area if view == "area" else px.line)(
-        monthly, x="DateTime", y=sources_sel,
-        template=theme["template"],
+        _sources_data(lo, hi, sources_sel), x="DateTime", y=sources_sel,
+        template=theme["template"], **extra,
         title=f"Producción por fuente (mensual, {'área apilada' if view == 'area' else 'líneas'})"
     )
     fig.update_layout(legend_title_text="Fuentes", margin=dict(l=10, r=10, t=50, b=10))
     return fig
 
 
-@callback(Output('graph-monthly-bar', 'figure'),
-          Input('date-range', 'start_date'), Input('date-range', 'end_date'),
-          Input('bar-var-dropdown', 'value'), Input('bar-agg-radio', 'value'),
-          Input('theme-store', 'data'))
-def update_bar(start_date, end_date, var, agg, theme):
-    """Update the monthly aggregate bar chart based on aggregation method."""
-    dff = _filter(df, start_date, end_date)
+def update_bar(lo, hi, var, agg, theme):
+    """Build the monthly aggregate bar chart based on aggregation method."""
+    dfa = _monthly_bar_data(lo, hi, var, agg)
     if agg == "sum":
-        dfa, subtitle = dff.groupby("MonthStart", as_index=False)[var].sum(), "Suma mensual"
+        subtitle = "Suma mensual"
     elif agg == "mean":
-        dfa, subtitle = dff.groupby("MonthStart", as_index=False)[var].mean(), "Promedio mensual"
+        subtitle = "Promedio mensual"
     else:
-        dfa, subtitle = dff.groupby("MonthStart", as_index=False)[var].max(), "Máximo mensual"
+        subtitle = "Máximo mensual"
     fig = px.bar(
         dfa, x="MonthStart", y=var,
         template=theme["template"],
@@ -309,20 +714,13 @@ def update_bar(start_date, end_date, var, agg, theme):
     return fig
 
 
-@callback(Output('graph-heatmap', 'figure'),
-          Input('date-range', 'start_date'), Input('date-range', 'end_date'),
-          Input('heat-var-dropdown', 'value'), Input('theme-store', 'data'))
-def update_heatmap(start_date, end_date, var, theme):
-    """Update the heatmap representing average values by hour and weekday."""
-    dff = _filter(df, start_date, end_date)
-    pv = dff.pivot_table(index="Weekday", columns="Hour", values=var, aggfunc="mean")
-    order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-    pv = pv.reindex(order, axis=0, fill_value=0.0)
+def update_heatmap(lo, hi, var, theme):
+    """Build the heatmap representing average values by hour and weekday."""
     fig = go.Figure(data=go.Heatmap(
-        z=pv.values.astype(float),
-        x=list(pv.columns), y=list(pv.index),
+        z=_heatmap_data(lo, hi, var),
+        x=list(range(24)), y=WEEKDAYS,
         colorbar_title=f"Prom {var}",
-        hoverongaps=False
+        connectgaps=False, hoverongaps=False
     ))
     fig.update_layout(
         title=f"Promedio por hora vs día: {var}",
@@ -333,6 +731,54 @@ def update_heatmap(start_date, end_date, var, theme):
     return fig
 
 
+# Which graph each input feeds; the date range (and the initial call)
+# redraws all of them.
+GRAPH_OF_INPUT = {
+    "metric-dropdown": "graph-line",
+    "graph-line": "graph-line",
+    "sources-checklist": "graph-sources",
+    "btn-area": "graph-sources",
+    "btn-lines": "graph-sources",
+    "bar-var-dropdown": "graph-monthly-bar",
+    "bar-agg-radio": "graph-monthly-bar",
+    "heat-var-dropdown": "graph-heatmap",
+}
+
+
+@callback(Output('graph-line', 'figure'), Output('graph-sources', 'figure'),
+          Output('graph-monthly-bar', 'figure'), Output('graph-heatmap', 'figure'),
+          Input('date-range', 'start_date'), Input('date-range', 'end_date'),
+          Input('metric-dropdown', 'value'),
+          Input('sources-checklist', 'value'),
+          Input('btn-area', 'n_clicks'), Input('btn-lines', 'n_clicks'),
+          Input('bar-var-dropdown', 'value'), Input('bar-agg-radio', 'value'),
+          Input('heat-var-dropdown', 'value'),
+          Input('graph-line', 'relayoutData'),
+          State('theme-store', 'data'))
+def update_graphs(start_date, end_date, metric, sources_sel, n_area, n_lines,
+                  bar_var, bar_agg, heat_var, relayout, theme):
+    """Redraw the graphs affected by the input that triggered the callback."""
+    window = None
+    if ctx.triggered_id == "graph-line":
+        # Only finished x-axis zooms (box zoom, range buttons) and resets change
+        # what the line chart needs to send.  The range slider reports every
+        # mouse move as "xaxis.range", so those events are ignored rather
+        # than sending a callback per frame of a drag.
+        relayout = relayout or {}
+        if not ("xaxis.range[0]" in relayout or "xaxis.autorange" in relayout):
+            return [no_update] * 4
+        window = _zoom_window(relayout)
+    lo, hi = _bounds(start_date, end_date)
+    builders = {
+        "graph-line": lambda: update_line(lo, hi, metric, theme, window),
+        "graph-sources": lambda: update_sources(lo, hi, sources_sel, n_area, n_lines, theme),
+        "graph-monthly-bar": lambda: update_bar(lo, hi, bar_var, bar_agg, theme),
+        "graph-heatmap": lambda: update_heatmap(lo, hi, heat_var, theme),
+    }
+    target = GRAPH_OF_INPUT.get(ctx.triggered_id)
+    return [build() if target in (None, graph) else no_update for graph, build in builders.items()]
+
+
 if __name__ == '__main__':
     # Run the Dash development server for local debugging.  In production,
     # Render will invoke gunicorn with the ``app:server`` WSGI entrypoint.